@@ -240,10 +240,8 @@ __submodules__ = [
     'ipython_extension',
 ]
 
-__autogen__ = """
-mkinit ./line_profiler/__init__.py --relative
-mkinit ./line_profiler/__init__.py --relative -w
-"""
+# NOTE: This file is maintained by hand (the public names below are loaded
+# lazily), so it should no longer be regenerated with `mkinit`
 
 
 # from .line_profiler import __version__
@@ -251,18 +249,63 @@ mkinit ./line_profiler/__init__.py --relative -w
 # NOTE: This needs to be in sync with ../kernprof.py and line_profiler.py
 __version__ = '5.0.2'
 
-from .line_profiler import (
-    LineProfiler,
-    LineStats,
-    load_ipython_extension,
-    load_stats,
-    main,
-    show_func,
-    show_text,
-)
-
-
-from .explicit_profiler import profile
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from typing import Any
+
+    from . import line_profiler
+    from .explicit_profiler import profile
+    from .line_profiler import (
+        LineProfiler,
+        LineStats,
+        load_ipython_extension,
+        load_stats,
+        main,
+        show_func,
+        show_text,
+    )
+
+
+# The public names are loaded lazily (PEP 562), so that e.g.
+# ``from line_profiler import profile`` doesn't load the C extension
+_LAZY_ATTRS = {
+    'LineProfiler': 'line_profiler',
+    'LineStats': 'line_profiler',
+    'load_ipython_extension': 'line_profiler',
+    'load_stats': 'line_profiler',
+    'main': 'line_profiler',
+    'show_func': 'line_profiler',
+    'show_text': 'line_profiler',
+    'profile': 'explicit_profiler',
+}
+
+
+def __getattr__(name: str) -> 'Any':
+    import importlib
+
+    try:
+        submodule = _LAZY_ATTRS[name]
+    except KeyError:
+        # Submodules used to be reachable as attributes since they were
+        # imported eagerly, so keep resolving them
+        modname = f'{__name__}.{name}'
+        if not name.startswith('__'):
+            try:
+                return importlib.import_module(modname)
+            except ModuleNotFoundError as e:
+                if e.name != modname:
+                    raise
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+    value = getattr(importlib.import_module(f'{__name__}.{submodule}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> 'list[str]':
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
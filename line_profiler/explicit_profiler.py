@@ -169,17 +169,20 @@ import atexit
 import multiprocessing
 import os
 import pathlib
+import shutil
 import sys
+import time
 import typing
 from typing import Any, Callable, TypeVar
 
 if typing.TYPE_CHECKING:
+    from .line_profiler import LineProfiler
+
     ConfigArg = str | pathlib.PurePath | bool | None
 
 
 # This is for compatibility
 from .cli_utils import boolean, get_python_executable as _python_command
-from .line_profiler import LineProfiler
 from .toml_config import ConfigSource
 
 F = TypeVar('F', bound=Callable[..., Any])
@@ -191,6 +194,21 @@ F = TypeVar('F', bound=Callable[..., Any])
 _OWNER_PID_ENVVAR: str = 'LINE_PROFILER_OWNER_PID'
 
 
+def _identity(func: F) -> F:
+    return func
+
+
+def __getattr__(name: str) -> Any:
+    # `LineProfiler` is no longer imported at module level (so that a
+    # disabled `@profile` doesn't load the C extension), but still resolve
+    # it for code which imports it from here
+    if name == 'LineProfiler':
+        from .line_profiler import LineProfiler
+
+        return LineProfiler
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 class GlobalProfiler:
     """
     Manages a profiler that will output on interpreter exit.
@@ -226,6 +244,10 @@ class GlobalProfiler:
         write_config (Dict[str, bool]):
             Which outputs are enabled;
             options are lprof, text, timestamped_text, and stdout.
+            If both text and timestamped_text are enabled, the latter is
+            written as a hard link to the former where the filesystem
+            allows it (and copied otherwise), so editing one of the
+            files in place also changes the other.
             Defaults to the rest of the ``[tool.line_profiler.write]``
             table of the loaded config file.
 
@@ -245,6 +267,7 @@ class GlobalProfiler:
 
     Example:
         >>> from line_profiler.explicit_profiler import *  # NOQA
+        >>> from line_profiler import LineProfiler
         >>> self = GlobalProfiler()
         >>> # Setting the _profile attribute prevents atexit from running.
         >>> self._profile = LineProfiler()
@@ -279,7 +302,7 @@ class GlobalProfiler:
     _config: pathlib.PurePath | None
     _profile: LineProfiler | None
     _owner_pid: int | None
-    enabled: bool | None
+    _enabled: bool | None
 
     setup_config: dict[str, list[str]]
     write_config: dict[str, Any]
@@ -309,7 +332,7 @@ class GlobalProfiler:
         # supplied `config`)
         self.show_config.pop('column_widths')
 
-    def _kernprof_overwrite(self, profile: LineProfiler) -> None:
+    def _kernprof_overwrite(self, profile: LineProfiler | None) -> None:
         """
         Kernprof will call this when it runs, so we can use its profile object
         instead of our own. Note: when kernprof overwrites us we wont register
@@ -319,6 +342,33 @@ class GlobalProfiler:
         self._profile = profile
         self.enabled = True
 
+    @property
+    def enabled(self) -> bool | None:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool | None) -> None:
+        self._enabled = enabled
+        # Specialize `.__call__()` for the new state; subclasses defined
+        # elsewhere are left alone so that they keep their own overrides
+        if type(self) not in (
+            GlobalProfiler,
+            _EnabledGlobalProfiler,
+            _DisabledGlobalProfiler,
+        ):
+            return
+        if enabled is None:
+            cls: type[GlobalProfiler] = GlobalProfiler
+        elif not enabled:
+            cls = _DisabledGlobalProfiler
+        elif self._profile is None:
+            # Nothing to wrap with (e.g. kernprof has uninstalled its
+            # profiler), leave it to the unspecialized `.__call__()`
+            cls = GlobalProfiler
+        else:
+            cls = _EnabledGlobalProfiler
+        self.__class__ = cls
+
     def _implicit_setup(self) -> None:
         """
         Called once the first time the user decorates a function with
@@ -327,10 +377,14 @@ class GlobalProfiler:
         """
         environ_flags = self.setup_config['environ_flags']
         cli_flags = self.setup_config['cli_flags']
+        environ = os.environ
+        # Unset/empty variables (the common case) are falsy; don't bother
+        # parsing them
         is_profiling = any(
-            boolean(os.environ.get(f, ''), fallback=True) for f in environ_flags
+            value and boolean(value, fallback=True)
+            for value in map(environ.get, environ_flags)
         )
-        is_profiling |= any(f in sys.argv for f in cli_flags)
+        is_profiling = is_profiling or not set(cli_flags).isdisjoint(sys.argv)
         if is_profiling:
             self.enable()
         else:
@@ -350,12 +404,12 @@ class GlobalProfiler:
 
         if is_mp_bootstrap():
             self._debug('enable:skip-mp-bootstrap')
-            self.enabled = False
+            self.disable()
             return
 
         if self._should_skip_due_to_owner():
             self._debug('enable:skip-due-to-owner')
-            self.enabled = False
+            self.disable()
             return
 
         owner_pid = os.getpid()
@@ -364,6 +418,9 @@ class GlobalProfiler:
         self._debug('enable:owner-claimed', owner_pid=owner_pid)
 
         if self._profile is None:
+            # Only load the C extension once we actually need a profiler
+            from .line_profiler import LineProfiler
+
             atexit.register(self.show)
             self._profile = LineProfiler()
 
@@ -438,6 +495,15 @@ class GlobalProfiler:
 
         Returns:
             Callable: a potentially wrapped function
+
+        Note:
+            Setting :py:attr:`enabled` (which the implicit setup,
+            :py:meth:`enable`, :py:meth:`disable`, and kernprof all do)
+            specializes a :py:class:`GlobalProfiler` instance into
+            :py:class:`_EnabledGlobalProfiler` or
+            :py:class:`_DisabledGlobalProfiler`, whose :py:meth:`__call__`
+            skip the checks below; setting it back to :py:data:`None`
+            undoes that.
         """
         # from multiprocessing import current_process
         # if current_process().name != 'MainProcess':
@@ -468,7 +534,6 @@ class GlobalProfiler:
         if self._owner_pid is not None and os.getpid() != self._owner_pid:
             self._debug('show:skip-non-owner', current_pid=os.getpid())
             return
-        import io
 
         write_stdout = self.write_config['stdout']
         write_text = self.write_config['text']
@@ -482,31 +547,38 @@ class GlobalProfiler:
             self._profile.print_stats(**kwargs)
 
         if write_text or write_timestamped_text:
-            stream = io.StringIO()
             # Text output always contains details, and cannot be rich.
             text_kwargs: dict[str, Any] = {
                 **kwargs,
                 'rich': False,
                 'details': True,
             }
-            self._profile.print_stats(stream=stream, **text_kwargs)
-            raw_text = stream.getvalue()
-
+            txt_output_fpaths: list[pathlib.Path] = []
             if write_text:
                 txt_output_fpath1 = pathlib.Path(f'{self.output_prefix}.txt')
-                txt_output_fpath1.write_text(raw_text, encoding='utf-8')
-                print('Wrote profile results to %s' % txt_output_fpath1)
-
+                # Don't write through a hard link left by a previous run into
+                # its timestamped copy
+                txt_output_fpath1.unlink(missing_ok=True)
+                txt_output_fpaths.append(txt_output_fpath1)
             if write_timestamped_text:
-                from datetime import datetime as datetime_cls
-
-                now = datetime_cls.now()
-                timestamp = now.strftime('%Y-%m-%dT%H%M%S')
+                timestamp = time.strftime('%Y-%m-%dT%H%M%S')
                 txt_output_fpath2 = pathlib.Path(
                     f'{self.output_prefix}_{timestamp}.txt'
                 )
-                txt_output_fpath2.write_text(raw_text, encoding='utf-8')
-                print('Wrote profile results to %s' % txt_output_fpath2)
+                txt_output_fpaths.append(txt_output_fpath2)
+
+            # Render straight to the first file instead of buffering the text
+            first_fpath, *other_fpaths = txt_output_fpaths
+            with open(first_fpath, 'w', encoding='utf-8') as stream:
+                self._profile.print_stats(stream=stream, **text_kwargs)
+            print('Wrote profile results to %s' % first_fpath)
+            for txt_output_fpath in other_fpaths:
+                # Same content, so just link (or copy) the file
+                try:
+                    os.link(first_fpath, txt_output_fpath)
+                except OSError:
+                    shutil.copyfile(first_fpath, txt_output_fpath)
+                print('Wrote profile results to %s' % txt_output_fpath)
 
         if write_lprof:
             lprof_output_fpath = pathlib.Path(f'{self.output_prefix}.lprof')
@@ -517,6 +589,29 @@ class GlobalProfiler:
             print(py_exe + ' -m line_profiler -rtmz ' + str(lprof_output_fpath))
 
 
+class _EnabledGlobalProfiler(GlobalProfiler):
+    """
+    State of a :py:class:`GlobalProfiler` with :py:attr:`~.enabled` set
+    to :py:data:`True` and a managed profiler: decorated functions are
+    always wrapped by that profiler.
+    """
+
+    _profile: LineProfiler
+
+    def __call__(self, func: Callable) -> Callable:
+        return self._profile(func)
+
+
+class _DisabledGlobalProfiler(GlobalProfiler):
+    """
+    State of a :py:class:`GlobalProfiler` with :py:attr:`~.enabled` set
+    to :py:data:`False`: decorated functions are returned as-is.
+    """
+
+    # No need to bind `self` just to hand back the input
+    __call__ = staticmethod(_identity)  # type: ignore[assignment]
+
+
 def is_mp_bootstrap() -> bool:
     """
     True when this interpreter invocation looks like multiprocessing
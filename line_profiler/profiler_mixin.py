@@ -16,7 +16,6 @@ from typing import (
     Sequence,
 )
 from warnings import warn
-from ._line_profiler import label
 from .scoping_policy import ScopingPolicy
 
 
@@ -118,7 +117,17 @@ if TYPE_CHECKING:
         @property
         def func_closure(self): ...
 else:
-    CythonCallable = type(label)
+
+    def __getattr__(name: str) -> Any:
+        # Resolve the runtime `CythonCallable` on first access, so that
+        # importing this module doesn't require loading the C extension
+        if name == 'CythonCallable':
+            from ._line_profiler import label
+
+            cython_callable = globals()[name] = type(label)
+            return cython_callable
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 CLevelCallable = TypeVar(
     'CLevelCallable',
@@ -602,6 +602,145 @@ def test_explicit_profile_with_customized_config():
         assert 'Function: fib' in proc.stdout  # With details
 
 
+def test_global_profiler_specialization(monkeypatch):
+    """
+    Test that :py:class:`GlobalProfiler` instances specialize their
+    ``__call__`` when enabled and disabled.
+    """
+    from line_profiler import LineProfiler
+    from line_profiler.explicit_profiler import (
+        _OWNER_PID_ENVVAR,
+        GlobalProfiler,
+        _DisabledGlobalProfiler,
+        _EnabledGlobalProfiler,
+    )
+
+    # Don't leak the ownership marker set by `.enable()` (an empty value
+    # means no owner, and is removed again on teardown)
+    monkeypatch.setenv(_OWNER_PID_ENVVAR, '')
+
+    def func(x):
+        return x + 1
+
+    profile = GlobalProfiler()
+    # Setting the _profile attribute prevents atexit from running.
+    profile._profile = LineProfiler()
+    assert type(profile) is GlobalProfiler
+    profile.disable()
+    assert type(profile) is _DisabledGlobalProfiler
+    assert profile(func) is func
+    profile.enable()
+    assert type(profile) is _EnabledGlobalProfiler
+    wrapped = profile(func)
+    assert wrapped is not func
+    assert wrapped(1) == 2
+    assert func.__code__ in profile._profile.code_map
+    # Replacing the managed profiler takes effect immediately
+    new_profiler = profile._profile = LineProfiler()
+    profile(func)
+    assert func.__code__ in new_profiler.code_map
+    profile.disable()
+    assert profile(func) is func
+    assert isinstance(profile, GlobalProfiler)
+    # Kernprof installs and then uninstalls its own profiler
+    kernprof_profiler = LineProfiler()
+    profile._kernprof_overwrite(kernprof_profiler)
+    assert type(profile) is _EnabledGlobalProfiler
+    profile(func)
+    assert func.__code__ in kernprof_profiler.code_map
+    profile._kernprof_overwrite(None)
+    assert type(profile) is GlobalProfiler
+
+
+def test_global_profiler_set_enabled(monkeypatch):
+    """
+    Test that setting :py:attr:`GlobalProfiler.enabled` directly is
+    respected, both by :py:class:`GlobalProfiler` and its subclasses.
+    """
+    from line_profiler import LineProfiler
+    from line_profiler.explicit_profiler import GlobalProfiler
+
+    class MyProfiler(GlobalProfiler):
+        def __call__(self, func):
+            self.calls = getattr(self, 'calls', 0) + 1
+            return super().__call__(func)
+
+    monkeypatch.delenv('LINE_PROFILE', raising=False)
+
+    def func(x):
+        return x + 1
+
+    for cls in GlobalProfiler, MyProfiler:
+        profile = cls()
+        # Setting the _profile attribute prevents atexit from running.
+        profile._profile = LineProfiler()
+        profile.enabled = True
+        assert profile(func) is not func
+        profile.enabled = False
+        assert profile(func) is func
+        profile.enabled = True
+        assert profile(func) is not func
+        # Resetting to `None` re-runs the implicit setup (which doesn't
+        # enable profiling here), on the next decoration
+        profile.enabled = None
+        assert type(profile) is cls
+        assert profile(func) is func
+        assert profile.enabled is False
+        assert isinstance(profile, cls)
+        if cls is MyProfiler:
+            assert type(profile) is MyProfiler
+            assert profile.calls == 4
+
+
+def test_global_profiler_show_text_outputs():
+    """
+    Test that the timestamped text output written by
+    :py:meth:`GlobalProfiler.show` is a hard link to the plain one, and
+    that rewriting the latter leaves older copies alone.
+    """
+    from line_profiler import LineProfiler
+    from line_profiler.explicit_profiler import GlobalProfiler
+
+    def func(x):
+        return x + 1
+
+    profile = GlobalProfiler()
+    # Setting the _profile attribute prevents atexit from running.
+    profile._profile = LineProfiler()
+    profile.write_config.update(
+        stdout=False, text=True, timestamped_text=True, lprof=False
+    )
+    profile.output_prefix = 'prof'
+    wrapped = profile._profile(func)
+    wrapped(1)
+
+    with enter_tmpdir() as curdir:
+        probe_fpath = curdir / 'probe'
+        probe_fpath.touch()
+        try:
+            os.link(probe_fpath, curdir / 'probe_link')
+        except OSError:
+            pytest.skip('Hard links not supported')
+
+        profile.show()
+        text_fpath = curdir / 'prof.txt'
+        (copy_fpath,) = set(curdir.glob('prof_*.txt'))
+        assert os.path.samefile(text_fpath, copy_fpath)
+        old_text = text_fpath.read_text()
+        assert 'return x + 1' in old_text
+
+        # The copy from the earlier run still shares the file
+        old_fpath = curdir / 'prof_old.txt'
+        os.replace(copy_fpath, old_fpath)
+        wrapped(2)
+        wrapped(3)
+        profile.show()
+        new_text = text_fpath.read_text()
+        assert new_text != old_text
+        assert not os.path.samefile(text_fpath, old_fpath)
+        assert old_fpath.read_text() == old_text
+
+
 @pytest.mark.parametrize('reset_enable_count', [True, False])
 @pytest.mark.parametrize(
     'wrap_class, wrap_module',
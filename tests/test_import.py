@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
 
 def test_import():
     import line_profiler
@@ -19,3 +22,66 @@ def test_version():
     assert (
         line_profiler_version1 == line_profiler_version2 == kernprof_version
     ), 'All 3 places should have the same version'
+
+
+def test_lazy_import():
+    """
+    Test that importing the ``profile`` decorator doesn't load the C
+    extension until it is actually needed.
+    """
+    code = (
+        'import sys; '
+        'from line_profiler import profile; '
+        "assert 'line_profiler._line_profiler' not in sys.modules; "
+        'profile.disable(); '
+        'profile(print); '
+        "assert 'line_profiler._line_profiler' not in sys.modules; "
+        'import line_profiler; '
+        'line_profiler.LineProfiler; '
+        "assert 'line_profiler._line_profiler' in sys.modules"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_submodules():
+    """
+    Test that submodules are still reachable as attributes of the package
+    without being imported explicitly.
+    """
+    code = (
+        'import line_profiler; '
+        'line_profiler.explicit_profiler.GlobalProfiler; '
+        'line_profiler.toml_config.ConfigSource; '
+        'line_profiler.cli_utils.boolean; '
+        'line_profiler.scoping_policy.ScopingPolicy; '
+        'line_profiler.profiler_mixin.ByCountProfilerMixin; '
+        'line_profiler._line_profiler.label; '
+        "assert not hasattr(line_profiler, 'no_such_submodule')"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_namespace():
+    """
+    Test that the lazily-loaded namespaces only expose what they should.
+    """
+    import line_profiler
+    from line_profiler.explicit_profiler import LineProfiler
+
+    assert LineProfiler is line_profiler.LineProfiler
+    names = dir(line_profiler)
+    assert set(line_profiler.__all__) <= set(names)
+    assert 'typing' not in names
+    assert 'annotations' not in names
+
+
+def test_cython_callable_type():
+    """
+    Test that :py:data:`line_profiler.profiler_mixin.CythonCallable`
+    (resolved lazily) is the type of Cython functions.
+    """
+    from line_profiler._line_profiler import label
+    from line_profiler.profiler_mixin import CythonCallable, is_cython_callable
+
+    assert CythonCallable is type(label)
+    assert is_cython_callable(label)